@@ -0,0 +1,45 @@
+"""Compare CWT (COSE_Mac0) and JWT token size and verify throughput.
+
+Run with ``python python/benchmarks/bench_cwt.py [iterations]``.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jwt import ValidationOptions, encode, encode_cwt, verify, verify_cwt
+
+KEY = b"0123456789abcdef0123456789abcdef"
+NOW = 1_700_000_000
+PAYLOAD = {
+    "iss": "https://issuer.example",
+    "sub": "device-0042",
+    "aud": "telemetry",
+    "exp": NOW + 3600,
+    "nbf": NOW,
+    "iat": NOW,
+    "jti": "0f8fad5b-d9cb-469f-a165-70867728950e",
+}
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    options = ValidationOptions(now=NOW, issuer=PAYLOAD["iss"], audience=PAYLOAD["aud"])
+
+    print(f"{'alg':<6} {'format':<5} {'bytes':>6} {'verify/s':>10}")
+    for alg in ("HS256", "HS384", "HS512"):
+        jwt_token = encode(PAYLOAD, KEY, alg)
+        cwt_token = encode_cwt(PAYLOAD, KEY, alg)
+
+        for label, token, verifier in (("JWT", jwt_token, verify), ("CWT", cwt_token, verify_cwt)):
+            elapsed = timeit.timeit(
+                lambda: verifier(token, KEY, algorithms=[alg], options=options),
+                number=iterations,
+            )
+            print(f"{alg:<6} {label:<5} {len(token):>6} {iterations / elapsed:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
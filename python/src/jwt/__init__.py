@@ -2,6 +2,7 @@
 
 from .algorithms import list_algorithms
 from .claims import ValidationOptions
+from .cwt import decode as decode_cwt, encode as encode_cwt, verify as verify_cwt
 from .errors import (
     InvalidClaimError,
     InvalidSignatureError,
@@ -13,9 +14,12 @@ from .token import decode, encode, verify
 
 __all__ = [
     "decode",
+    "decode_cwt",
     "encode",
+    "encode_cwt",
     "list_algorithms",
     "verify",
+    "verify_cwt",
     "ValidationOptions",
     "InvalidClaimError",
     "InvalidSignatureError",
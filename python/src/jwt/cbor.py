@@ -0,0 +1,215 @@
+"""Minimal CBOR (RFC 8949) codec used by the CWT helpers."""
+
+from __future__ import annotations
+
+import math
+import struct
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+from .errors import InvalidTokenError
+
+_MAX_DEPTH = 16
+
+_UINT = 0
+_NEGINT = 1
+_BYTES = 2
+_TEXT = 3
+_ARRAY = 4
+_MAP = 5
+_TAG = 6
+_SIMPLE = 7
+
+_FALSE = 0xF4
+_TRUE = 0xF5
+_NULL = 0xF6
+
+
+@dataclass(frozen=True)
+class Tag:
+    tag: int
+    value: Any
+
+
+def _encode_head(major: int, length: int) -> bytes:
+    prefix = major << 5
+    if length < 0:
+        raise InvalidTokenError("CBOR integer is out of range")
+    if length < 24:
+        return bytes((prefix | length,))
+    if length < 0x100:
+        return bytes((prefix | 24, length))
+    if length < 0x10000:
+        return bytes((prefix | 25,)) + length.to_bytes(2, "big")
+    if length < 0x100000000:
+        return bytes((prefix | 26,)) + length.to_bytes(4, "big")
+    if length < 0x10000000000000000:
+        return bytes((prefix | 27,)) + length.to_bytes(8, "big")
+    raise InvalidTokenError("CBOR integer is out of range")
+
+
+def _encode_float(value: float) -> bytes:
+    if math.isnan(value):
+        return b"\xf9\x7e\x00"
+    # Shortest of half, single, or double precision that preserves the value.
+    for info, fmt in ((25, ">e"), (26, ">f")):
+        try:
+            packed = struct.pack(fmt, value)
+        except OverflowError:
+            continue
+        if struct.unpack(fmt, packed)[0] == value:
+            return bytes(((_SIMPLE << 5) | info,)) + packed
+    return bytes(((_SIMPLE << 5) | 27,)) + struct.pack(">d", value)
+
+
+def _encode_into(value: Any, out: List[bytes], depth: int) -> None:
+    if depth > _MAX_DEPTH:
+        raise InvalidTokenError("CBOR nesting is too deep")
+    if value is None:
+        out.append(bytes((_NULL,)))
+    elif value is True:
+        out.append(bytes((_TRUE,)))
+    elif value is False:
+        out.append(bytes((_FALSE,)))
+    elif isinstance(value, int):
+        if value >= 0:
+            out.append(_encode_head(_UINT, value))
+        else:
+            out.append(_encode_head(_NEGINT, -1 - value))
+    elif isinstance(value, float):
+        out.append(_encode_float(value))
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        raw = bytes(value)
+        out.append(_encode_head(_BYTES, len(raw)))
+        out.append(raw)
+    elif isinstance(value, str):
+        raw = value.encode("utf-8")
+        out.append(_encode_head(_TEXT, len(raw)))
+        out.append(raw)
+    elif isinstance(value, (list, tuple)):
+        out.append(_encode_head(_ARRAY, len(value)))
+        for item in value:
+            _encode_into(item, out, depth + 1)
+    elif isinstance(value, dict):
+        # Core deterministic encoding (RFC 8949 section 4.2.1): keys sorted bytewise by their encoded form.
+        entries = []
+        for key, item in value.items():
+            if isinstance(key, bool) or not isinstance(key, (int, str)):
+                raise InvalidTokenError("CBOR map keys must be integers or text strings")
+            encoded_key: List[bytes] = []
+            _encode_into(key, encoded_key, depth + 1)
+            entries.append((b"".join(encoded_key), item))
+        entries.sort(key=lambda entry: entry[0])
+        out.append(_encode_head(_MAP, len(entries)))
+        for encoded_key_bytes, item in entries:
+            out.append(encoded_key_bytes)
+            _encode_into(item, out, depth + 1)
+    elif isinstance(value, Tag):
+        out.append(_encode_head(_TAG, value.tag))
+        _encode_into(value.value, out, depth + 1)
+    else:
+        raise InvalidTokenError(f"CBOR cannot encode value of type {type(value).__name__}")
+
+
+def cbor_dumps(value: Any) -> bytes:
+    """Serialize a value to deterministic CBOR."""
+    out: List[bytes] = []
+    _encode_into(value, out, 0)
+    return b"".join(out)
+
+
+_HEAD_SIZES = {24: 1, 25: 2, 26: 4, 27: 8}
+
+
+class _Decoder:
+    __slots__ = ("data", "pos", "end")
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+        self.end = len(data)
+
+    def _take(self, length: int) -> bytes:
+        start = self.pos
+        end = start + length
+        if end > self.end:
+            raise InvalidTokenError("CBOR input is truncated")
+        self.pos = end
+        return self.data[start:end]
+
+    def decode(self, depth: int = 0) -> Any:
+        if depth > _MAX_DEPTH:
+            raise InvalidTokenError("CBOR nesting is too deep")
+        data = self.data
+        pos = self.pos
+        if pos >= self.end:
+            raise InvalidTokenError("CBOR input is truncated")
+        initial = data[pos]
+        pos += 1
+        major = initial >> 5
+        info = initial & 0x1F
+        if info < 24:
+            arg = info
+        else:
+            size = _HEAD_SIZES.get(info)
+            if size is None:
+                raise InvalidTokenError("CBOR indefinite lengths are not supported")
+            if pos + size > self.end:
+                raise InvalidTokenError("CBOR input is truncated")
+            arg = int.from_bytes(data[pos:pos + size], "big")
+            pos += size
+        self.pos = pos
+
+        if major == _UINT:
+            return arg
+        if major == _NEGINT:
+            return -1 - arg
+        if major == _BYTES:
+            return self._take(arg)
+        if major == _TEXT:
+            try:
+                return self._take(arg).decode("utf-8")
+            except UnicodeDecodeError as exc:
+                raise InvalidTokenError("CBOR text string is not valid UTF-8") from exc
+        if major == _ARRAY:
+            return [self.decode(depth + 1) for _ in range(arg)]
+        if major == _MAP:
+            result: Dict[Any, Any] = {}
+            for _ in range(arg):
+                key = self.decode(depth + 1)
+                if isinstance(key, bool) or not isinstance(key, (int, str)):
+                    raise InvalidTokenError("CBOR map keys must be integers or text strings")
+                if key in result:
+                    raise InvalidTokenError("CBOR map contains duplicate keys")
+                result[key] = self.decode(depth + 1)
+            return result
+        if major == _TAG:
+            return Tag(tag=arg, value=self.decode(depth + 1))
+        return self._decode_simple(info, arg)
+
+    def _decode_simple(self, info: int, arg: int) -> Any:
+        if info == 20:
+            return False
+        if info == 21:
+            return True
+        if info == 22:
+            return None
+        if info == 25:
+            return struct.unpack(">e", arg.to_bytes(2, "big"))[0]
+        if info == 26:
+            return struct.unpack(">f", arg.to_bytes(4, "big"))[0]
+        if info == 27:
+            return struct.unpack(">d", arg.to_bytes(8, "big"))[0]
+        raise InvalidTokenError("CBOR simple value is not supported")
+
+
+def cbor_loads(data: bytes) -> Any:
+    """Parse a single CBOR data item, rejecting trailing bytes."""
+    if not isinstance(data, (bytes, bytearray, memoryview)):
+        raise InvalidTokenError("CBOR input must be bytes")
+    decoder = _Decoder(bytes(data))
+    value = decoder.decode()
+    if decoder.pos != decoder.end:
+        raise InvalidTokenError("CBOR input has trailing bytes")
+    return value
+
@@ -0,0 +1,213 @@
+"""CWT (RFC 8392) encode/decode/verify helpers using COSE_Mac0."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from .algorithms import get_algorithm
+from .cbor import Tag, cbor_dumps, cbor_loads
+from .claims import ValidationOptions, validate_standard_claims
+from .errors import InvalidSignatureError, InvalidTokenError, UnsupportedAlgorithmError
+from .keys import KeyLike, ensure_bytes
+
+_CWT_TAG = 61
+_COSE_MAC0_TAG = 17
+_MAC0_PREFIX = b"\x84\x64MAC0"
+_EMPTY_AAD = b"\x40"
+
+_CLAIM_LABELS: Dict[str, int] = {
+    "iss": 1,
+    "sub": 2,
+    "aud": 3,
+    "exp": 4,
+    "nbf": 5,
+    "iat": 6,
+    "jti": 7,
+}
+_CLAIM_NAMES: Dict[int, str] = {label: name for name, label in _CLAIM_LABELS.items()}
+
+_HEADER_LABELS: Dict[str, int] = {
+    "alg": 1,
+    "crit": 2,
+    "cty": 3,
+    "kid": 4,
+    "typ": 16,
+}
+_HEADER_NAMES: Dict[int, str] = {label: name for name, label in _HEADER_LABELS.items()}
+
+_COSE_ALGORITHMS: Dict[str, int] = {
+    "HS256": 5,
+    "HS384": 6,
+    "HS512": 7,
+}
+_JOSE_ALGORITHMS: Dict[int, str] = {label: name for name, label in _COSE_ALGORITHMS.items()}
+
+
+@dataclass(frozen=True)
+class CWTDecodeResult:
+    # Unprotected parameters are merged into ``header`` for key selection (e.g. ``kid``);
+    # protected entries win, and claim/typ/crit checks only read ``protected_header``.
+    header: Dict[Any, Any]
+    protected_header: Dict[Any, Any]
+    payload: Dict[Any, Any]
+    signature: bytes
+    signing_input: bytes
+
+
+def _mac_structure(protected: bytes, payload: bytes) -> bytes:
+    # Same bytes as cbor_dumps(["MAC0", protected, b"", payload]) with a fixed prefix.
+    return b"".join((_MAC0_PREFIX, cbor_dumps(protected), _EMPTY_AAD, cbor_dumps(payload)))
+
+
+def _ensure_label(key: Any, kind: str) -> None:
+    if isinstance(key, bool) or not isinstance(key, (int, str)):
+        raise InvalidTokenError(f"{kind} keys must be integers or strings")
+
+
+def _claims_to_cbor(payload: Mapping[Any, Any]) -> Dict[Any, Any]:
+    claims: Dict[Any, Any] = {}
+    for name, value in payload.items():
+        _ensure_label(name, "Claim")
+        label = _CLAIM_LABELS.get(name, name) if isinstance(name, str) else name
+        if label in claims:
+            raise InvalidTokenError(f"Claim '{name}' is duplicated")
+        if label == _CLAIM_LABELS["jti"] and isinstance(value, str):
+            value = value.encode("utf-8")
+        claims[label] = value
+    return claims
+
+
+def _claims_from_cbor(claims: Mapping[Any, Any]) -> Dict[Any, Any]:
+    payload: Dict[Any, Any] = {}
+    for label, value in claims.items():
+        # Registered claims are only read from integer labels; text keys are distinct labels in CWT.
+        if isinstance(label, str) and label in _CLAIM_LABELS:
+            raise InvalidTokenError(f"Claim '{label}' must use its integer label")
+        name = _CLAIM_NAMES.get(label, label) if isinstance(label, int) else label
+        if name == "jti" and isinstance(value, bytes):
+            # Non-UTF-8 cti values stay bytes; verify rejects them through the jti string check.
+            try:
+                value = value.decode("utf-8")
+            except UnicodeDecodeError:
+                pass
+        payload[name] = value
+    return payload
+
+
+def _header_from_cbor(parameters: Mapping[Any, Any]) -> Dict[Any, Any]:
+    header: Dict[Any, Any] = {}
+    for label, value in parameters.items():
+        # Registered parameters are only read from integer labels; text keys are distinct labels in COSE.
+        if isinstance(label, str) and label in _HEADER_LABELS:
+            raise InvalidTokenError(f"Header '{label}' must use its integer label")
+        name = _HEADER_NAMES.get(label, label) if isinstance(label, int) else label
+        header[name] = value
+    return header
+
+
+def _protected_header_from_cbor(protected: Mapping[Any, Any]) -> Dict[Any, Any]:
+    header = _header_from_cbor(protected)
+    alg = header.get("alg")
+    if isinstance(alg, bool) or not isinstance(alg, int):
+        raise InvalidTokenError("Header 'alg' must be an integer")
+    if alg not in _JOSE_ALGORITHMS:
+        raise UnsupportedAlgorithmError(f"Algorithm '{alg}' is not supported")
+    header["alg"] = _JOSE_ALGORITHMS[alg]
+    return header
+
+
+def decode(token: bytes) -> CWTDecodeResult:
+    if not isinstance(token, (bytes, bytearray, memoryview)):
+        raise InvalidTokenError("Token must be bytes")
+
+    message = cbor_loads(token)
+    if isinstance(message, Tag) and message.tag == _CWT_TAG:
+        message = message.value
+    if isinstance(message, Tag):
+        if message.tag != _COSE_MAC0_TAG:
+            raise InvalidTokenError("Token must be a COSE_Mac0 message")
+        message = message.value
+    if not isinstance(message, list) or len(message) != 4:
+        raise InvalidTokenError("COSE_Mac0 message must have exactly four parts")
+
+    encoded_protected, unprotected, encoded_payload, mac = message
+    if not isinstance(encoded_protected, bytes) or not isinstance(encoded_payload, bytes):
+        raise InvalidTokenError("COSE_Mac0 protected header and payload must be byte strings")
+    if not isinstance(unprotected, dict) or not isinstance(mac, bytes):
+        raise InvalidTokenError("COSE_Mac0 message is malformed")
+
+    protected = cbor_loads(encoded_protected) if encoded_protected else {}
+    claims = cbor_loads(encoded_payload)
+    if not isinstance(protected, dict) or not isinstance(claims, dict):
+        raise InvalidTokenError("Token protected header and payload must be CBOR maps")
+
+    protected_header = _protected_header_from_cbor(protected)
+    unprotected_header = _header_from_cbor(unprotected)
+    if "crit" in unprotected_header:
+        raise InvalidTokenError("Header 'crit' must be integrity protected")
+
+    return CWTDecodeResult(
+        header={**unprotected_header, **protected_header},
+        protected_header=protected_header,
+        payload=_claims_from_cbor(claims),
+        signature=mac,
+        signing_input=_mac_structure(encoded_protected, encoded_payload),
+    )
+
+
+def encode(
+    payload: Mapping[Any, Any],
+    key: KeyLike,
+    alg: str,
+    headers: Optional[Mapping[Any, Any]] = None,
+) -> bytes:
+    if not isinstance(payload, Mapping):
+        raise InvalidTokenError("Payload must be a mapping")
+    if alg not in _COSE_ALGORITHMS:
+        raise UnsupportedAlgorithmError(f"Algorithm '{alg}' is not supported")
+
+    protected: Dict[Any, Any] = {_HEADER_LABELS["alg"]: _COSE_ALGORITHMS[alg]}
+    if headers:
+        for name, value in headers.items():
+            _ensure_label(name, "Header")
+            label = _HEADER_LABELS.get(name, name)
+            if label == _HEADER_LABELS["alg"]:
+                raise InvalidTokenError("Header 'alg' must be set via the alg argument")
+            if label in protected:
+                raise InvalidTokenError(f"Header '{name}' is duplicated")
+            if label == _HEADER_LABELS["kid"] and isinstance(value, str):
+                value = value.encode("utf-8")
+            protected[label] = value
+
+    encoded_protected = cbor_dumps(protected)
+    encoded_payload = cbor_dumps(_claims_to_cbor(payload))
+
+    algorithm = get_algorithm(alg)
+    mac = algorithm.sign(ensure_bytes(key), _mac_structure(encoded_protected, encoded_payload))
+
+    return cbor_dumps(Tag(_COSE_MAC0_TAG, [encoded_protected, {}, encoded_payload, mac]))
+
+
+def verify(
+    token: bytes,
+    key: KeyLike,
+    algorithms: Optional[Iterable[str]] = None,
+    options: Optional[ValidationOptions] = None,
+) -> Dict[Any, Any]:
+    result = decode(token)
+    alg = result.protected_header["alg"]
+
+    if algorithms is not None and alg not in set(algorithms):
+        raise InvalidSignatureError("Token algorithm is not allowed")
+
+    algorithm = get_algorithm(alg)
+    algorithm.verify(ensure_bytes(key), result.signing_input, result.signature)
+
+    if "crit" in result.protected_header:
+        raise InvalidTokenError("Header 'crit' parameters are not supported")
+
+    validation_options = options or ValidationOptions()
+    validate_standard_claims(result.payload, validation_options, header=result.protected_header)
+
+    return result.payload
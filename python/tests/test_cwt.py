@@ -0,0 +1,247 @@
+import math
+import os
+import sys
+import unittest
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from jwt import (
+    ValidationOptions,
+    decode_cwt,
+    encode,
+    encode_cwt,
+    verify_cwt,
+    InvalidClaimError,
+    InvalidSignatureError,
+    InvalidTokenError,
+    UnsupportedAlgorithmError,
+)
+from jwt.cbor import Tag, cbor_dumps, cbor_loads
+
+
+class CBORTests(unittest.TestCase):
+    def test_rfc8949_vectors(self) -> None:
+        vectors = [
+            (0, "00"),
+            (23, "17"),
+            (24, "1818"),
+            (1000, "1903e8"),
+            (1_000_000_000_000, "1b000000e8d4a51000"),
+            (-1, "20"),
+            (-1000, "3903e7"),
+            (b"\x01\x02\x03\x04", "4401020304"),
+            ("IETF", "6449455446"),
+            ("ü", "62c3bc"),
+            ([1, [2, 3], [4, 5]], "8301820203820405"),
+            ({1: 2, 3: 4}, "a201020304"),
+            (False, "f4"),
+            (True, "f5"),
+            (None, "f6"),
+            (Tag(1, 1363896240), "c11a514b67b0"),
+        ]
+        for value, expected in vectors:
+            self.assertEqual(cbor_dumps(value).hex(), expected)
+            self.assertEqual(cbor_loads(bytes.fromhex(expected)), value)
+
+    def test_floats_use_shortest_form(self) -> None:
+        vectors = [
+            (0.0, "f90000"),
+            (-0.0, "f98000"),
+            (1.0, "f93c00"),
+            (1.5, "f93e00"),
+            (65504.0, "f97bff"),
+            (5.960464477539063e-8, "f90001"),
+            (-4.0, "f9c400"),
+            (100000.0, "fa47c35000"),
+            (3.4028234663852886e38, "fa7f7fffff"),
+            (1.1, "fb3ff199999999999a"),
+            (1.0e300, "fb7e37e43c8800759c"),
+            (float("inf"), "f97c00"),
+            (float("-inf"), "f9fc00"),
+        ]
+        for value, expected in vectors:
+            self.assertEqual(cbor_dumps(value).hex(), expected)
+            self.assertEqual(cbor_loads(bytes.fromhex(expected)), value)
+
+        self.assertEqual(cbor_dumps(float("nan")).hex(), "f97e00")
+        self.assertTrue(math.isnan(cbor_loads(bytes.fromhex("f97e00"))))
+
+    def test_map_keys_are_sorted_bytewise(self) -> None:
+        self.assertEqual(cbor_dumps({"a": 1, 10: 2, -1: 3}).hex(), "a30a022003616101")
+        self.assertEqual(cbor_dumps({100: 1, -1: 2}).hex(), "a21864012002")
+
+    def test_rejects_unsupported_map_keys(self) -> None:
+        for key in (1.5, (1, 2), True, b"k", None):
+            with self.assertRaises(InvalidTokenError):
+                cbor_dumps({key: "x"})
+
+    def test_rejects_out_of_range_heads(self) -> None:
+        for value in (Tag(-1, 0), Tag(1 << 64, 0), 1 << 64, -(1 << 64) - 1):
+            with self.assertRaises(InvalidTokenError):
+                cbor_dumps(value)
+
+    def test_rejects_malformed_input(self) -> None:
+        for encoded in ("19", "62c3", "0000", "9f", "a201020103", "c0"):
+            with self.assertRaises(InvalidTokenError):
+                cbor_loads(bytes.fromhex(encoded))
+
+
+class CWTTests(unittest.TestCase):
+    def test_encode_decode_roundtrip(self) -> None:
+        payload = {"iss": "issuer-a", "sub": "user-123", "exp": 1_800_000_000, "jti": "abc", "scope": "read"}
+        for alg in ("HS256", "HS384", "HS512"):
+            token = encode_cwt(payload, "secret", alg)
+
+            result = decode_cwt(token)
+            self.assertEqual(result.header["alg"], alg)
+            self.assertEqual(result.payload, payload)
+
+            verified = verify_cwt(token, "secret", algorithms=[alg], options=ValidationOptions(now=1_700_000_000))
+            self.assertEqual(verified, payload)
+
+    def test_uses_integer_claim_keys(self) -> None:
+        token = encode_cwt({"sub": "user-123", "exp": 1_800_000_000, "jti": "abc"}, "secret", "HS256")
+        message = cbor_loads(token)
+        self.assertEqual(message.tag, 17)
+        self.assertEqual(cbor_loads(message.value[0]), {1: 5})
+        self.assertEqual(cbor_loads(message.value[2]), {2: "user-123", 4: 1_800_000_000, 7: b"abc"})
+
+    def test_is_smaller_than_jwt(self) -> None:
+        payload = {"iss": "issuer-a", "sub": "user-123", "exp": 1_800_000_000}
+        self.assertLess(len(encode_cwt(payload, "secret", "HS256")), len(encode(payload, "secret", "HS256")))
+
+    def test_accepts_cwt_tag(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256")
+        wrapped = cbor_dumps(Tag(61, cbor_loads(token)))
+        self.assertEqual(verify_cwt(wrapped, "secret", algorithms=["HS256"])["sub"], "user-123")
+
+    def test_verify_rejects_invalid_signature(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256")
+        with self.assertRaises(InvalidSignatureError):
+            verify_cwt(token, "wrong-secret", algorithms=["HS256"])
+
+        tampered = token[:-1] + bytes((token[-1] ^ 1,))
+        with self.assertRaises(InvalidSignatureError):
+            verify_cwt(tampered, "secret", algorithms=["HS256"])
+
+    def test_verify_rejects_disallowed_algorithm(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256")
+        with self.assertRaises(InvalidSignatureError):
+            verify_cwt(token, "secret", algorithms=["HS384"])
+
+    def test_rejects_unsupported_algorithm(self) -> None:
+        with self.assertRaises(UnsupportedAlgorithmError):
+            encode_cwt({"sub": "user-123"}, "secret", "RS256")
+
+    def test_verify_applies_standard_claim_rules(self) -> None:
+        token = encode_cwt({"iss": "issuer-a", "aud": "service-a", "exp": 1_700_000_000}, "secret", "HS256")
+        with self.assertRaises(InvalidClaimError):
+            verify_cwt(token, "secret", algorithms=["HS256"], options=ValidationOptions(now=1_700_000_000))
+        with self.assertRaises(InvalidClaimError):
+            verify_cwt(
+                token,
+                "secret",
+                algorithms=["HS256"],
+                options=ValidationOptions(now=1_600_000_000, audience="service-b"),
+            )
+
+        verified = verify_cwt(
+            token,
+            "secret",
+            algorithms=["HS256"],
+            options=ValidationOptions(now=1_600_000_000, issuer="issuer-a", audience="service-a"),
+        )
+        self.assertEqual(verified["iss"], "issuer-a")
+
+    def test_encode_rejects_alg_header_override(self) -> None:
+        for headers in ({"alg": 7}, {1: 7}):
+            with self.assertRaises(InvalidTokenError):
+                encode_cwt({"sub": "user-123"}, "secret", "HS256", headers=headers)
+
+        with self.assertRaises(InvalidTokenError):
+            encode_cwt({"sub": "user-123"}, "secret", "HS256", headers={"kid": b"a", 4: b"b"})
+
+    def test_encode_rejects_unsupported_keys(self) -> None:
+        for payload in ({1.5: "x"}, {(1, 2): "x"}, {True: "x"}, {True: "a", "iss": "b"}):
+            with self.assertRaisesRegex(InvalidTokenError, "keys must be integers or strings"):
+                encode_cwt(payload, "secret", "HS256")
+
+        with self.assertRaisesRegex(InvalidTokenError, "keys must be integers or strings"):
+            encode_cwt({"sub": "user-123"}, "secret", "HS256", headers={True: 7})
+
+    def test_encode_writes_kid_as_byte_string(self) -> None:
+        for headers in ({"kid": "key-1"}, {4: "key-1"}):
+            token = encode_cwt({"sub": "user-123"}, "secret", "HS256", headers=headers)
+            self.assertEqual(cbor_loads(cbor_loads(token).value[0]), {1: 5, 4: b"key-1"})
+            self.assertEqual(decode_cwt(token).header["kid"], b"key-1")
+
+    def test_non_utf8_cti_is_only_rejected_after_mac_check(self) -> None:
+        token = encode_cwt({"sub": "user-123", 7: b"\xff\x00"}, "secret", "HS256")
+        self.assertEqual(decode_cwt(token).payload["jti"], b"\xff\x00")
+
+        with self.assertRaises(InvalidSignatureError):
+            verify_cwt(token, "wrong-secret", algorithms=["HS256"])
+        with self.assertRaises(InvalidClaimError):
+            verify_cwt(token, "secret", algorithms=["HS256"])
+
+    def test_verify_rejects_crit_header(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256", headers={"crit": [100], 100: True})
+        with self.assertRaises(InvalidTokenError):
+            verify_cwt(token, "secret", algorithms=["HS256"])
+
+    def test_decode_reads_registered_headers_only_from_integer_labels(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256")
+        for protected in ({"alg": 5}, {1: 5, "alg": 7}):
+            message = cbor_loads(token)
+            message.value[0] = cbor_dumps(protected)
+            with self.assertRaises(InvalidTokenError):
+                decode_cwt(cbor_dumps(message))
+
+        message = cbor_loads(token)
+        message.value[1] = {"kid": b"key-1"}
+        with self.assertRaises(InvalidTokenError):
+            decode_cwt(cbor_dumps(message))
+
+    def test_decode_reads_registered_claims_only_from_integer_labels(self) -> None:
+        token = encode_cwt({"sub": "user-123", 8: "cnf", "scope": "read"}, "secret", "HS256")
+        self.assertEqual(decode_cwt(token).payload, {"sub": "user-123", 8: "cnf", "scope": "read"})
+
+        message = cbor_loads(token)
+        message.value[2] = cbor_dumps({"exp": 1_700_000_000})
+        with self.assertRaises(InvalidTokenError):
+            decode_cwt(cbor_dumps(message))
+
+    def test_decode_exposes_unprotected_header(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256", headers={"typ": "application/cwt"})
+        message = cbor_loads(token)
+        message.value[1] = {4: b"key-1", 1: 7, 16: "other"}
+        token = cbor_dumps(message)
+
+        result = decode_cwt(token)
+        self.assertEqual(result.header, {"alg": "HS256", "kid": b"key-1", "typ": "application/cwt"})
+        self.assertEqual(result.protected_header, {"alg": "HS256", "typ": "application/cwt"})
+        self.assertEqual(verify_cwt(token, "secret", algorithms=["HS256"])["sub"], "user-123")
+
+    def test_verify_ignores_unprotected_typ(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256")
+        message = cbor_loads(token)
+        message.value[1] = {16: "application/cwt"}
+        with self.assertRaises(InvalidClaimError):
+            verify_cwt(cbor_dumps(message), "secret", algorithms=["HS256"], options=ValidationOptions(typ="cwt"))
+
+    def test_decode_rejects_unprotected_crit(self) -> None:
+        token = encode_cwt({"sub": "user-123"}, "secret", "HS256")
+        message = cbor_loads(token)
+        message.value[1] = {2: [100]}
+        with self.assertRaises(InvalidTokenError):
+            decode_cwt(cbor_dumps(message))
+
+    def test_decode_requires_cose_mac0(self) -> None:
+        with self.assertRaises(InvalidTokenError):
+            decode_cwt(cbor_dumps(Tag(18, [b"", {}, b"", b""])))
+        with self.assertRaises(InvalidTokenError):
+            decode_cwt(cbor_dumps([b"", {}, b""]))
+
+
+if __name__ == "__main__":
+    unittest.main()